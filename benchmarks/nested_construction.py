@@ -0,0 +1,92 @@
+"""
+Benchmark constructing a dynamic list serializer and resolving its nested fields for the selection
+"id,comments.user.username", and serializing a page of posts with it.
+
+Run from the repository root: python -m benchmarks.nested_construction
+"""
+import os
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+django.setup()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+
+from drf_dynamic_serializers.serializers import DynamicFieldsModelSerializer  # noqa: E402
+from tests.models import Comment, Post  # noqa: E402
+
+POSTS = 50
+COMMENTS_PER_POST = 3
+REPEAT = 500
+SELECTIONS = (None, ["id", "comments.user.username"], ["id"])
+
+
+class UserSerializer(DynamicFieldsModelSerializer):
+    class Meta:
+        model = User
+        fields = "__all__"
+
+
+class CommentSerializer(DynamicFieldsModelSerializer):
+    user = UserSerializer()
+
+    class Meta:
+        model = Comment
+        fields = "__all__"
+
+
+class PostSerializer(DynamicFieldsModelSerializer):
+    comments = CommentSerializer(many=True)
+
+    class Meta:
+        model = Post
+        fields = "__all__"
+
+
+def construct(queryset, included_fields):
+    serializer = PostSerializer(queryset, many=True, included_fields=included_fields)
+    fields = serializer.child.fields
+
+    # resolve the nested fields like serializing the first row would
+    if "comments" in fields:
+        comment_fields = fields["comments"].child.fields
+        if "user" in comment_fields:
+            comment_fields["user"].fields
+
+    return serializer
+
+
+def main():
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+    user = User.objects.create(username="user")
+    for _ in range(POSTS):
+        post = Post.objects.create(title="title", body="body")
+        for _ in range(COMMENTS_PER_POST):
+            Comment.objects.create(post=post, user=user, text="text")
+
+    posts = list(Post.objects.prefetch_related("comments__user"))
+
+    print("{:>32} {:>14} {:>14}".format("selection", "construct", "serialize"))
+
+    for selection in SELECTIONS:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            construct(posts, selection)
+        constructed = (time.perf_counter() - start) / REPEAT
+
+        start = time.perf_counter()
+        for _ in range(REPEAT // 10):
+            PostSerializer(posts, many=True, included_fields=selection).data
+        serialized = (time.perf_counter() - start) / (REPEAT // 10)
+
+        print("{:>32} {:>12.1f}us {:>12.1f}us".format(
+            ",".join(selection or ["<all>"]), constructed * 1e6, serialized * 1e6
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark in-process vs. process pool serialization of a list of rows, to find the number of rows at which
+DynamicFieldsParallelListSerializer starts to pay off.
+
+Run from the repository root: python -m benchmarks.parallel_serialization
+"""
+import os
+import time
+from datetime import datetime
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+django.setup()
+
+from rest_framework import serializers  # noqa: E402
+
+from drf_dynamic_serializers.parallel import get_executor  # noqa: E402
+from drf_dynamic_serializers.serializers import (  # noqa: E402
+    DynamicFieldsParallelListSerializer,
+    DynamicFieldsSerializer,
+)
+
+SIZES = (1000, 5000, 10000, 50000, 100000)
+CHUNK_SIZE = 2000
+
+
+class Row:
+    def __init__(self, i: int):
+        self.id = i
+        self.name = "row {}".format(i)
+        self.email = "row{}@example.com".format(i)
+        self.amount = i * 1.5
+        self.active = i % 2 == 0
+        self.created = datetime(2020, 1, 1)
+        self.tags = ["a", "b", "c"]
+
+
+class RowSerializer(DynamicFieldsSerializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    email = serializers.EmailField()
+    amount = serializers.FloatField()
+    active = serializers.BooleanField()
+    created = serializers.DateTimeField()
+    tags = serializers.ListField(child=serializers.CharField())
+
+
+class ParallelListSerializer(DynamicFieldsParallelListSerializer):
+    min_rows = 0
+    chunk_size = CHUNK_SIZE
+
+
+class ParallelRowSerializer(RowSerializer):
+    class Meta:
+        list_serializer_class = ParallelListSerializer
+
+
+def timed(serializer_class, rows) -> float:
+    start = time.perf_counter()
+    serializer_class(rows, many=True, excluded_fields=["tags"]).data
+    return time.perf_counter() - start
+
+
+def main():
+    # start the workers before measuring
+    get_executor().submit(int).result()
+
+    print("workers: {}, chunk size: {}".format(os.cpu_count(), CHUNK_SIZE))
+    print("{:>8} {:>12} {:>12} {:>8}".format("rows", "in-process", "parallel", "speedup"))
+
+    for size in SIZES:
+        rows = [Row(i) for i in range(size)]
+        sequential = timed(RowSerializer, rows)
+        parallel = timed(ParallelRowSerializer, rows)
+        print("{:>8} {:>11.3f}s {:>11.3f}s {:>7.2f}x".format(size, sequential, parallel, sequential / parallel))
+
+
+if __name__ == "__main__":
+    main()
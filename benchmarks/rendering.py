@@ -0,0 +1,74 @@
+"""
+Benchmark serializing and rendering 10k rows with JSONRenderer vs. DynamicFieldsJSONRenderer.
+
+Run from the repository root: python -m benchmarks.rendering
+"""
+import os
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Tuple
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+django.setup()
+
+from rest_framework import serializers  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from drf_dynamic_serializers.renderers import DynamicFieldsJSONRenderer  # noqa: E402
+from drf_dynamic_serializers.serializers import DynamicFieldsSerializer  # noqa: E402
+
+ROWS = 10000
+REPEAT = 5
+
+
+class Row:
+    def __init__(self, i: int):
+        self.id = i
+        self.name = "row {}".format(i)
+        self.email = "row{}@example.com".format(i)
+        self.amount = Decimal(i) / 4
+        self.active = i % 2 == 0
+        self.created = datetime(2020, 1, 1)
+
+
+class RowSerializer(DynamicFieldsSerializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    email = serializers.EmailField()
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    active = serializers.BooleanField()
+    created = serializers.DateTimeField()
+
+
+def timed(renderer, rows) -> Tuple[float, float]:
+    serialize = render = 0.0
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        data = RowSerializer(rows, many=True, excluded_fields=["email"]).data
+        serialized = time.perf_counter()
+        renderer.render(data)
+        serialize += serialized - start
+        render += time.perf_counter() - serialized
+
+    return serialize / REPEAT, render / REPEAT
+
+
+def main():
+    rows = [Row(i) for i in range(ROWS)]
+
+    print("{} rows".format(ROWS))
+    print("{:>28} {:>12} {:>12} {:>12}".format("renderer", "serialize", "render", "total"))
+
+    for renderer in (JSONRenderer(), DynamicFieldsJSONRenderer()):
+        serialize, render = timed(renderer, rows)
+        print("{:>28} {:>11.3f}s {:>11.3f}s {:>11.3f}s".format(
+            type(renderer).__name__, serialize, render, serialize + render
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,13 @@
 from django.apps import AppConfig
 
 # ensure app settings are loaded
-from drf_dynamic_serializers.conf import settings
+from drf_dynamic_serializers.conf import app_settings, settings
 
 
 class DRFDynamicSerializersConfig(AppConfig):
     name = "drf_dynamic_serializers"
     verbose_name = "DRF Dynamic Serializers"
+
+    def ready(self):
+        # resolve the app settings once at startup instead of on every access
+        app_settings.load()
@@ -2,9 +2,10 @@ from typing import Optional, List
 
 # recommended by appconf package to import first
 from django.conf import settings
+from django.core.signals import setting_changed
 from appconf import AppConf
 
-__all__ = ("DynamicFieldsConfig",)
+__all__ = ("DynamicFieldsConfig", "app_settings")
 
 
 class DRFDynamicSerializersConf(AppConf):
@@ -13,11 +14,65 @@ class DRFDynamicSerializersConf(AppConf):
     QUERY_PARAM_INCLUDED_FIELDS = "fields"
     # query param to pass fields to exclude from response
     QUERY_PARAM_EXCLUDED_FIELDS = "exclude"
+    # query param to explain a request (only if settings.DEBUG is enabled)
+    QUERY_PARAM_EXPLAIN = "explain"
+    # minimum number of rows before a parallel list serializer serializes in a process pool
+    PARALLEL_MIN_ROWS = 5000
+    # number of rows that are serialized per task in a process pool
+    PARALLEL_CHUNK_SIZE = 1000
+    # number of worker processes (None defaults to the number of CPUs)
+    PARALLEL_MAX_WORKERS = None
 
     class Meta:
         prefix = "drf_dynamic_serializers"
 
 
+class AppSettings:
+    """
+    Settings of this app without their prefix (e.g. app_settings.QUERY_PARAM_INCLUDED_FIELDS). A setting is resolved
+    from the Django settings on first access and kept until the settings are reloaded (see reload_app_settings).
+    """
+
+    def __getattr__(self, name: str):
+        if name not in DRFDynamicSerializersConf._meta.names:
+            raise AttributeError("Invalid setting: '{}'".format(name))
+
+        value = getattr(settings, DRFDynamicSerializersConf._meta.names[name])
+
+        # cache the value, so that __getattr__ is not called for this setting anymore
+        setattr(self, name, value)
+
+        return value
+
+    def load(self) -> None:
+        """
+        Resolve all settings.
+        """
+        for name in DRFDynamicSerializersConf._meta.names:
+            getattr(self, name)
+
+    def reload(self) -> None:
+        """
+        Forget the resolved settings.
+        """
+        for name in DRFDynamicSerializersConf._meta.names:
+            self.__dict__.pop(name, None)
+
+
+app_settings = AppSettings()
+
+
+def reload_app_settings(setting: str, **kwargs) -> None:
+    """
+    Reload the app settings if setting 'setting' is one of them (e.g. when overridden in tests).
+    """
+    if setting in DRFDynamicSerializersConf._meta.names.values():
+        app_settings.reload()
+
+
+setting_changed.connect(reload_app_settings)
+
+
 class DynamicFieldsConfig:
     included_fields: Optional[List[str]]
     excluded_fields: Optional[List[str]]
@@ -0,0 +1,161 @@
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from django.db.models import QuerySet
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+__all__ = ("Explain", "QueryCollector")
+
+
+class QueryCollector:
+    """
+    Execute wrapper (see django.db.connection.execute_wrapper) that records the SQL (without params) and duration of
+    the executed queries.
+    """
+
+    queries: List[dict]
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute: Callable, sql: str, params, many: bool, context: dict):
+        start = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({"sql": sql, "time": perf_counter() - start})
+
+
+class Explain(QueryCollector):
+    """
+    Collects the metadata of a request in explain mode: the normalized field selection, the fields built and dropped
+    at each level, the queryset's loading options, the executed SQL queries and the time spent in field resolution,
+    serialization and SQL.
+    """
+
+    included_fields: Optional[List[str]]
+    excluded_fields: Optional[List[str]]
+    serializer: Optional[BaseSerializer]
+    queryset: Optional[QuerySet]
+
+    def __init__(self):
+        super().__init__()
+
+        self.included_fields = None
+        self.excluded_fields = None
+        self.serializer = None
+        self.queryset = None
+
+        self._field_resolution_time = 0.0
+        self._serialization_time = 0.0
+        self._serialization_sql_time = 0.0
+
+    def add_serializer(self, serializer: BaseSerializer) -> None:
+        """
+        Resolve the (nested) fields of serializer 'serializer' and time its serialization.
+        """
+        start = perf_counter()
+        # accessing the fields of every level resolves them, so that resolution does not count as serialization
+        get_field_tree(serializer)
+        self._field_resolution_time += perf_counter() - start
+
+        self.serializer = serializer
+        serializer.to_representation = self._timed_to_representation(serializer.to_representation)
+
+    def as_dict(self, total_time: float) -> dict:
+        """
+        Get the collected metadata, with times in milliseconds.
+        """
+        sql_time = sum(query["time"] for query in self.queries)
+
+        return {
+            "selection": {
+                "included": get_selection_tree(self.included_fields or []),
+                "excluded": get_selection_tree(self.excluded_fields or []),
+            },
+            "fields": get_field_tree(self.serializer) if self.serializer is not None else None,
+            "queryset": get_queryset_info(self.queryset) if self.queryset is not None else None,
+            "queries": [{"sql": query["sql"], "time": _ms(query["time"])} for query in self.queries],
+            "timings": {
+                "total": _ms(total_time),
+                "field_resolution": _ms(self._field_resolution_time),
+                # queries that are executed while serializing (e.g. lazy relations) are counted as sql only
+                "serialization": _ms(self._serialization_time - self._serialization_sql_time),
+                "sql": _ms(sql_time),
+            },
+        }
+
+    def _timed_to_representation(self, to_representation: Callable) -> Callable:
+        """
+        Wrap method 'to_representation' to add its duration (excluding its queries) to the serialization time.
+        """
+
+        @wraps(to_representation)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            num_queries = len(self.queries)
+
+            try:
+                return to_representation(*args, **kwargs)
+            finally:
+                self._serialization_time += perf_counter() - start
+                self._serialization_sql_time += sum(query["time"] for query in self.queries[num_queries:])
+
+        return wrapper
+
+
+def get_selection_tree(fields: List[str]) -> Dict[str, dict]:
+    """
+    Convert dotted field names 'fields' into a tree, e.g. ["a", "b.c"] -> {"a": {}, "b": {"c": {}}}.
+    """
+    tree = {}
+
+    for field in fields:
+        node = tree
+        for part in field.split("."):
+            node = node.setdefault(part, {})
+
+    return tree
+
+
+def get_field_tree(serializer: BaseSerializer) -> Dict[str, Any]:
+    """
+    Get the fields that are built and dropped by serializer 'serializer' and its nested serializers.
+    """
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+
+    fields = getattr(serializer, "fields", {})
+
+    return {
+        "serializer": type(serializer).__name__,
+        "built": list(fields),
+        "dropped": list(getattr(serializer, "_df_dropped_fields", ())),
+        "nested": {
+            name: get_field_tree(field)
+            for name, field in fields.items()
+            if isinstance(field, BaseSerializer)
+        },
+    }
+
+
+def get_queryset_info(queryset: QuerySet) -> dict:
+    """
+    Get the loading options that are applied to queryset 'queryset'.
+    """
+    field_names, defer = queryset.query.deferred_loading
+
+    return {
+        "only": None if defer else sorted(field_names),
+        "defer": sorted(field_names) if defer else None,
+        "select_related": queryset.query.select_related,
+        "prefetch_related": [
+            getattr(lookup, "prefetch_to", lookup) for lookup in queryset._prefetch_related_lookups
+        ],
+    }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
@@ -1,12 +1,25 @@
+import json
 from collections import defaultdict
-from typing import Callable, List, Tuple, Set
-
+from contextlib import ExitStack
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Set
+
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.expressions import Ref
+from django.http import HttpResponseBase, StreamingHttpResponse
 from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination
+from rest_framework.renderers import JSONRenderer
 from rest_framework.serializers import ListSerializer, Serializer
 from rest_framework.request import Request
+from rest_framework.response import Response
 
-from .conf import DynamicFieldsConfig, settings
+from .conf import DynamicFieldsConfig, app_settings, settings
 from .exceptions import SerializerDoesNotSupportDynamicFields
+from .explain import Explain
+from .projection import get_json_projection, supports_json_projection
+from .renderers import DynamicFieldsJSONRenderer
 
 __all__ = (
     "DynamicFieldsPolymorphicSerializerMixin",
@@ -82,6 +95,10 @@ class DynamicFieldsSerializerMixin:
     dynamic_fields = True
 
     _df_config: DynamicFieldsConfig
+    # names of the fields that were removed by the dynamic fields config
+    _df_dropped_fields: Tuple[str, ...] = ()
+    # excluded fields, included fields and nested excluded fields of the root level while the fields are built
+    _df_selection: Optional[Tuple[Set[str], Set[str], dict]] = None
 
     def __init__(self, *args, **kwargs):
         self._df_conf = DynamicFieldsConfig(
@@ -98,8 +115,6 @@ class DynamicFieldsSerializerMixin:
         """
         Get fields to serialize given the fields to include and fields to exclude.
         """
-        fields = super(DynamicFieldsSerializerMixin, self).fields
-
         included_fields_root, included_fields_nested = self._split_levels(
             self._df_conf.included_fields or []
         )
@@ -109,12 +124,22 @@ class DynamicFieldsSerializerMixin:
 
         # if there are fields to clean
         if len(included_fields_root) != 0 or len(excluded_fields_root) != 0:
-            self._clean_fields(
+            # only build the fields that will not be cleaned (see get_fields and get_field_names)
+            self._df_selection = (excluded_fields_root, included_fields_root, excluded_fields_nested)
+            try:
+                fields = super(DynamicFieldsSerializerMixin, self).fields
+            finally:
+                self._df_selection = None
+
+            # clean fields that are added regardless of the field names, e.g. hidden fields
+            self._df_dropped_fields += self._clean_fields(
                 fields,
                 excluded_fields_root,
                 included_fields_root,
                 excluded_fields_nested,
             )
+        else:
+            fields = super(DynamicFieldsSerializerMixin, self).fields
 
         # pass included and excluded fields to fields (used by nested serializers).
         for name, field in fields.items():
@@ -130,6 +155,34 @@ class DynamicFieldsSerializerMixin:
 
         return fields
 
+    def get_fields(self) -> dict:
+        """
+        Get fields, skipping the declared fields that are not selected (these are deep copied otherwise).
+        """
+        if self._df_selection is None:
+            return super().get_fields()
+
+        # shadow the class' declared fields while the fields are built
+        self._declared_fields = {
+            name: self._declared_fields[name] for name in self._select_field_names(list(self._declared_fields))
+        }
+        try:
+            return super().get_fields()
+        finally:
+            del self._declared_fields
+
+    def get_field_names(self, declared_fields: dict, info) -> List[str]:
+        """
+        Get names of the fields to build, skipping the fields that are not selected. Only used by model serializers,
+        which build the fields that are not declared from the model.
+        """
+        field_names = super().get_field_names(declared_fields, info)
+
+        if self._df_selection is None:
+            return field_names
+
+        return self._select_field_names(field_names)
+
     def set_df_config(self, config: DynamicFieldsConfig):
         """
         Set config 'config' as dynamic fields config.
@@ -156,10 +209,10 @@ class DynamicFieldsSerializerMixin:
         excluded_fields_root: Set[str],
         included_fields_root: Set[str],
         excluded_fields_nested: dict,
-    ) -> None:
+    ) -> Tuple[str, ...]:
         """
         Clean fields 'fields' given excluded fields 'excluded_fields_root', included fields 'included_fields_root' and
-        nested excluded fields 'excluded_fields_nested'.
+        nested excluded fields 'excluded_fields_nested'. Returns the names of the removed fields.
         """
         to_remove = []
 
@@ -178,6 +231,23 @@ class DynamicFieldsSerializerMixin:
         for remove_field in to_remove:
             fields.pop(remove_field)
 
+        return tuple(to_remove)
+
+    def _select_field_names(self, field_names: List[str]) -> List[str]:
+        """
+        Get the names in field names 'field_names' that are included given the selection of the fields that are being
+        built. The other names are added to the dropped fields.
+        """
+        selected = []
+
+        for field_name in field_names:
+            if self._is_field_included(field_name, *self._df_selection):
+                selected.append(field_name)
+            elif field_name not in self._df_dropped_fields:
+                self._df_dropped_fields += (field_name,)
+
+        return selected
+
     @staticmethod
     def _is_field_included(
         field_name: str,
@@ -228,7 +298,7 @@ class DynamicFieldsSerializerMixin:
         # if field has support for dynamic fields, then set df config
         if getattr(field, "dynamic_fields", False):
             field.set_df_config(df_config)
-        elif type(field) == ListSerializer and getattr(
+        elif isinstance(field, ListSerializer) and getattr(
             field.child, "dynamic_fields", False
         ):
             field.child.set_df_config(df_config)
@@ -238,15 +308,85 @@ class DynamicFieldsViewMixin:
     """
     Mixin for view(set)s that adds the ability to dynamically select the fields to include or exclude in a response by
     reading the query parameters in the request.
+
+    If settings.DEBUG is enabled, the explain query param returns the response data along with metadata about the
+    resolved fields, the queryset and the executed queries.
+
+    If json_projection is enabled, the list action lets the database build the response rows as JSON if all selected
+    fields are columns of the model or of (non-nullable) related models.
     """
     default_included_fields: List[str]
     default_excluded_fields: List[str]
 
+    # whether the database builds the rows of the list action as JSON (if possible)
+    json_projection: bool = False
+
     request: Request
 
     get_serializer_class: Callable
     get_serializer_context: Callable
 
+    # metadata collector of the current request if it is explained
+    _df_explain: Optional[Explain] = None
+
+    # JSON rows of the current request and the queryset they are built from
+    _df_json_rows: Optional[Tuple[QuerySet, QuerySet]] = None
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Dispatch request 'request' and, if requested, explain it.
+        """
+        if not self._is_explain_requested(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        self._df_explain = explain = Explain()
+
+        start = perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(explain))
+            response = super().dispatch(request, *args, **kwargs)
+        total_time = perf_counter() - start
+
+        if isinstance(response, Response):
+            response.data = {"data": response.data, "explain": explain.as_dict(total_time)}
+
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """
+        List the objects, letting the database build the rows as JSON if enabled and possible.
+        """
+        if not self.json_projection:
+            return super().list(request, *args, **kwargs)
+
+        # the queryset is filtered and the serializer is built once, for the projection as well as the fallback
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer(many=True)
+
+        response = self._list_json_projection(queryset, serializer)
+        if response is not None:
+            return response
+
+        page = self.paginate_queryset(queryset)
+        serializer.instance = queryset if page is None else page
+
+        if page is None:
+            return Response(serializer.data)
+
+        return self.get_paginated_response(serializer.data)
+
+    def filter_queryset(self, queryset):
+        """
+        Filter queryset 'queryset' and, if the request is explained, keep it.
+        """
+        queryset = super().filter_queryset(queryset)
+
+        if self._df_explain is not None:
+            self._df_explain.queryset = queryset
+
+        return queryset
+
     def get_serializer(self, *args, **kwargs) -> Serializer:
         """
         Get serializer given the dynamically excluded and/or included fields.
@@ -259,32 +399,185 @@ class DynamicFieldsViewMixin:
         kwargs["context"] = self.get_serializer_context()
 
         if self._is_eligible_for_dynamic_fields():
-            kwargs["included_fields"] = self._get_included_fields()
-            kwargs["excluded_fields"] = self._get_excluded_fields()
+            kwargs["included_fields"], kwargs["excluded_fields"] = self._get_selection()
 
-        return serializer_class(*args, **kwargs)
+        if self._df_explain is None:
+            return serializer_class(*args, **kwargs)
 
-    def _get_included_fields(self) -> List[str]:
+        self._df_explain.included_fields = kwargs.get("included_fields")
+        self._df_explain.excluded_fields = kwargs.get("excluded_fields")
+
+        serializer = serializer_class(*args, **kwargs)
+        self._df_explain.add_serializer(serializer)
+
+        return serializer
+
+    def get_count_queryset(self, queryset: QuerySet) -> QuerySet:
         """
-        Get names of the fields to include.
+        Get queryset to count the objects of queryset 'queryset' with. The count does not depend on the selected
+        fields, so the ordering, select_related, prefetch_related and the annotations that do not affect the number of
+        rows (non-aggregates that are not referenced by filters) are removed.
+        """
+        # JSON rows are counted with the queryset they are built from
+        if self._df_json_rows is not None and queryset is self._df_json_rows[0]:
+            queryset = self._df_json_rows[1]
+
+        # sliced and combined (e.g. union) querysets cannot be reordered
+        if queryset.query.combinator or not queryset.query.can_filter():
+            return queryset
+
+        # values() querysets do not support select_related and count the selected annotations
+        if queryset._fields is not None:
+            return queryset.order_by()
+
+        queryset = queryset.order_by().select_related(None).prefetch_related(None)
+        query = queryset.query
+
+        # distinct querysets count the selected annotations
+        if query.distinct or not query.annotations:
+            return queryset
+
+        referenced = self._get_referenced_annotations(query.where)
+        for annotation in query.annotations.values():
+            if annotation.contains_aggregate:
+                referenced |= self._get_referenced_annotations(annotation)
+
+        keep = {
+            alias
+            for alias, annotation in query.annotations.items()
+            if annotation.contains_aggregate or alias in referenced
+        }
+
+        if len(keep) != len(query.annotations):
+            query.annotations = {alias: query.annotations[alias] for alias in query.annotations if alias in keep}
+            if query.annotation_select_mask is not None:
+                query.set_annotation_mask(set(query.annotation_select_mask) & keep)
+
+        return queryset
+
+    @classmethod
+    def _get_referenced_annotations(cls, node) -> Set[str]:
+        """
+        Get aliases of the annotations that are referenced by (where) node or expression 'node'.
+        """
+        if isinstance(node, Ref):
+            return {node.refs}
+
+        children = getattr(node, "children", None)
+        if children is None:
+            get_source_expressions = getattr(node, "get_source_expressions", None)
+            children = get_source_expressions() if get_source_expressions is not None else []
+
+        referenced = set()
+        for child in children:
+            referenced |= cls._get_referenced_annotations(child)
+
+        return referenced
+
+    def _list_json_projection(self, queryset: QuerySet, serializer: ListSerializer) -> Optional[HttpResponseBase]:
+        """
+        List the objects of (filtered) queryset 'queryset' with rows that are built as JSON by the database, according
+        to (list) serializer 'serializer'. Returns None if the selected fields cannot be expressed in SQL, the list
+        serializer customizes the representation, the database cannot build JSON or the pagination needs model
+        instances.
+        """
+        if (
+            queryset._fields is not None
+            or type(serializer).to_representation is not ListSerializer.to_representation
+            or isinstance(self.paginator, CursorPagination)
+            or not supports_json_projection(connections[queryset.db])
+        ):
+            return None
+
+        expression = get_json_projection(serializer.child, queryset.model)
+        if expression is None:
+            return None
+
+        rows = (
+            queryset.select_related(None)
+            .prefetch_related(None)
+            .annotate(_df_json=expression)
+            .values_list("_df_json", flat=True)
+        )
+        self._df_json_rows = (rows, queryset)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response([json.loads(row) for row in page])
+
+        # the JSON text of PostgreSQL is not compact ('{"key" : value}'), so its rows are decoded and rendered
+        if connections[queryset.db].vendor != "sqlite" or not self._is_eligible_for_streaming():
+            return Response([json.loads(row) for row in rows])
+
+        return StreamingHttpResponse(self._stream_json_rows(rows), content_type="application/json")
+
+    @staticmethod
+    def _stream_json_rows(rows: Iterable[str]) -> Iterator[bytes]:
+        """
+        Stream JSON rows 'rows' as a JSON array.
+        """
+        yield b"["
+
+        separator = b""
+        for row in rows.iterator() if isinstance(rows, QuerySet) else rows:
+            # escape \u2028 and \u2029 like JSONRenderer
+            yield separator + row.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+            separator = b","
+
+        yield b"]"
+
+    def _is_eligible_for_streaming(self) -> bool:
+        """
+        Verify whether the JSON rows can be streamed to the response. This is the case if all of the following
+        conditions are fulfilled:
+        - request is not explained
+        - response is rendered by JSONRenderer or DynamicFieldsJSONRenderer (not a subclass, which may render
+          differently) as compact, unicode JSON without indentation
         """
+        renderer = getattr(self.request, "accepted_renderer", None)
+
         return (
-            self._parse_query_params_for_field(
-                settings.DRF_DYNAMIC_SERIALIZERS_QUERY_PARAM_INCLUDED_FIELDS
-            )
-            or self._get_default_included_fields()
+            self._df_explain is None
+            and type(renderer) in (JSONRenderer, DynamicFieldsJSONRenderer)
+            and renderer.compact
+            and not renderer.ensure_ascii
+            and renderer.get_indent(self.request.accepted_media_type, {}) is None
         )
 
+    def _get_selection(self) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """
+        Get names of the fields to include and names of the fields to exclude.
+        """
+        return self._get_included_fields(), self._get_excluded_fields()
+
+    def _get_query_param_selection(self) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """
+        Get names of the fields to include and names of the fields to exclude that are passed in the query params.
+        These are parsed once per request and stored on the request, since the serializer may be created several
+        times per request (e.g. by the browsable API). The defaults of the view are not stored, since another view may
+        handle the same request.
+        """
+        selection = getattr(self.request, "_df_query_param_selection", None)
+
+        if selection is None:
+            selection = self.request._df_query_param_selection = (
+                self._parse_query_params_for_field(app_settings.QUERY_PARAM_INCLUDED_FIELDS),
+                self._parse_query_params_for_field(app_settings.QUERY_PARAM_EXCLUDED_FIELDS),
+            )
+
+        return selection
+
+    def _get_included_fields(self) -> List[str]:
+        """
+        Get names of the fields to include.
+        """
+        return self._get_query_param_selection()[0] or self._get_default_included_fields()
+
     def _get_excluded_fields(self) -> List[str]:
         """
         Get names of the fields to exclude.
         """
-        return (
-            self._parse_query_params_for_field(
-                settings.DRF_DYNAMIC_SERIALIZERS_QUERY_PARAM_EXCLUDED_FIELDS
-            )
-            or self._get_default_excluded_fields()
-        )
+        return self._get_query_param_selection()[1] or self._get_default_excluded_fields()
 
     def _get_default_included_fields(self) -> List[str]:
         """
@@ -306,9 +599,23 @@ class DynamicFieldsViewMixin:
         """
         return self.request is not None and self.request.method == "GET"
 
+    @staticmethod
+    def _is_explain_requested(request) -> bool:
+        """
+        Verify whether request 'request' asks to be explained. Explaining is only available if settings.DEBUG is
+        enabled.
+        """
+        return (
+            settings.DEBUG
+            and app_settings.QUERY_PARAM_EXPLAIN in request.GET
+        )
+
     def _parse_query_params_for_field(self, field: str) -> List[str]:
         """
-        Get parsed value of query params for field 'field'.
+        Get parsed value of query params for field 'field', ignoring whitespace and empty names.
         """
         value = self.request.query_params.get(field)
-        return value.split(",") if value else None
+        if not value:
+            return None
+
+        return [name.strip() for name in value.split(",") if name.strip()] or None
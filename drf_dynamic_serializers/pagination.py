@@ -0,0 +1,136 @@
+from functools import partial
+from typing import Iterable, Optional, Set
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination, PageNumberPagination
+
+__all__ = (
+    "DynamicFieldsCursorPagination",
+    "DynamicFieldsLimitOffsetPagination",
+    "DynamicFieldsPageNumberPagination",
+)
+
+
+class CountQuerysetPaginator(Paginator):
+    """
+    Paginator that counts the objects with a separate queryset.
+    """
+
+    def __init__(self, object_list, per_page, count_queryset: Optional[QuerySet] = None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_queryset = count_queryset
+
+    @cached_property
+    def count(self) -> int:
+        """
+        Get the total number of objects.
+        """
+        if self.count_queryset is None:
+            return super().count
+
+        return self.count_queryset.count()
+
+
+class DynamicFieldsCountPaginationMixin:
+    """
+    Mixin for pagination classes that counts the objects with the view's count queryset (see
+    DynamicFieldsViewMixin.get_count_queryset).
+    """
+
+    view = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_count_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Get queryset to count the objects of queryset 'queryset' with.
+        """
+        get_count_queryset = getattr(self.view, "get_count_queryset", None)
+
+        if get_count_queryset is None or not isinstance(queryset, QuerySet):
+            return queryset
+
+        return get_count_queryset(queryset)
+
+
+class DynamicFieldsPageNumberPagination(DynamicFieldsCountPaginationMixin, PageNumberPagination):
+    """
+    Page number pagination that counts the objects with the view's count queryset.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        self.django_paginator_class = partial(
+            CountQuerysetPaginator, count_queryset=self.get_count_queryset(queryset)
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+
+class DynamicFieldsLimitOffsetPagination(DynamicFieldsCountPaginationMixin, LimitOffsetPagination):
+    """
+    Limit offset pagination that counts the objects with the view's count queryset.
+    """
+
+    def get_count(self, queryset) -> int:
+        return super().get_count(self.get_count_queryset(queryset))
+
+
+class DynamicFieldsCursorPagination(CursorPagination):
+    """
+    Keyset (seek) pagination, which does not count the objects. If the fields to load are limited (e.g. with only()),
+    the cursor's ordering fields are loaded as well, so that building the cursor does not query every deferred field.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if isinstance(queryset, QuerySet):
+            queryset = self._load_ordering_fields(queryset, self.get_ordering(request, queryset, view))
+
+        return super().paginate_queryset(queryset, request, view)
+
+    @staticmethod
+    def _load_ordering_fields(queryset: QuerySet, ordering: Iterable[str]) -> QuerySet:
+        """
+        Make sure that the (local) fields of ordering 'ordering' are loaded by queryset 'queryset'.
+        """
+        field_names, defer = queryset.query.deferred_loading
+        ordering_field_names = DynamicFieldsCursorPagination._get_local_field_names(queryset, ordering)
+
+        if not defer:
+            # only() replaces the fields to load
+            missing = ordering_field_names - set(field_names)
+            return queryset.only(*field_names, *missing) if missing else queryset
+
+        deferred = set(field_names) - ordering_field_names
+        if len(deferred) == len(field_names):
+            return queryset
+
+        return queryset.defer(None).defer(*deferred) if deferred else queryset.defer(None)
+
+    @staticmethod
+    def _get_local_field_names(queryset: QuerySet, ordering: Iterable[str]) -> Set[str]:
+        """
+        Get names of the concrete fields of the model of queryset 'queryset' in ordering 'ordering'. Annotations and
+        fields of related models are skipped.
+        """
+        field_names = set()
+
+        for name in ordering:
+            name = name.lstrip("-")
+
+            if "__" in name or name in queryset.query.annotations:
+                continue
+
+            try:
+                field = queryset.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+
+            if field.concrete:
+                field_names.add(field.name)
+
+        return field_names
@@ -0,0 +1,174 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from rest_framework.serializers import BaseSerializer, ListSerializer, Serializer
+
+__all__ = ("SerializerDescription", "describe_serializer", "get_executor", "serialize_chunk", "serialize_chunks")
+
+
+# names of the resolved fields of a serializer, each with the resolved fields of its nested serializer (or None)
+FieldTree = Tuple[Tuple[str, Optional["FieldTree"]], ...]
+
+
+class SerializerDescription(NamedTuple):
+    """
+    Compact, picklable description of a (child) serializer and its resolved fields. It is sent to the worker processes
+    instead of the live serializer, which holds bound fields, context and a parent.
+    """
+
+    serializer_class: Type[Serializer]
+    fields: FieldTree
+
+
+# maximum number of serializers that a worker process keeps, since the descriptions depend on the requested fields
+SERIALIZER_CACHE_SIZE = 128
+
+# process pools of the current process, keyed by their number of workers
+_executors: Dict[int, ProcessPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def describe_serializer(serializer: Serializer) -> SerializerDescription:
+    """
+    Get the description of serializer 'serializer'. The resolved fields are taken from the serializer itself, so that
+    fields that are removed at runtime (e.g. depending on the context) are not serialized by the workers either.
+    """
+    return SerializerDescription(serializer_class=type(serializer), fields=_get_field_tree(serializer))
+
+
+def get_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Get the (shared) process pool with 'max_workers' workers. Defaults to the number of CPUs.
+
+    Workers are spawned instead of forked, so that they do not share the database connections (or locks of other
+    threads) of the process that serves the requests. They set up Django and open their own connections.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+
+        return _executors[max_workers]
+
+
+def serialize_chunks(
+    description: SerializerDescription, chunks: Sequence[List[Any]], max_workers: Optional[int] = None
+) -> List[dict]:
+    """
+    Serialize chunks of rows 'chunks' with the serializer described by description 'description' in the process pool
+    with 'max_workers' workers. The serialized rows are returned in order.
+
+    A pool breaks for good if one of its workers dies (e.g. when it is killed for running out of memory), so a broken
+    pool is dropped and the next call creates a new one.
+    """
+    executor = get_executor(max_workers)
+
+    try:
+        # map returns the results in the order of the chunks
+        return [row for chunk in executor.map(serialize_chunk, repeat(description), chunks) for row in chunk]
+    except BrokenProcessPool:
+        with _executors_lock:
+            for key in [key for key, value in _executors.items() if value is executor]:
+                del _executors[key]
+
+        executor.shutdown(wait=False)
+        raise
+
+
+def serialize_chunk(description: SerializerDescription, rows: List[Any]) -> List[dict]:
+    """
+    Serialize rows 'rows' with the serializer described by description 'description'. Runs in a worker process.
+    """
+    serializer = _get_serializer(description)
+
+    return [serializer.to_representation(row) for row in rows]
+
+
+@lru_cache(maxsize=SERIALIZER_CACHE_SIZE)
+def _get_serializer(description: SerializerDescription) -> Serializer:
+    """
+    Build the serializer described by description 'description'. The serializer (and therefore its resolved fields)
+    is reused for all chunks with the same description, as long as it is one of the most recently used ones.
+    """
+    kwargs = {}
+
+    if getattr(description.serializer_class, "dynamic_fields", False):
+        # only build the resolved fields
+        kwargs["included_fields"] = list(_get_field_paths(description.fields))
+
+    serializer = description.serializer_class(**kwargs)
+    _select_fields(serializer, description.fields)
+
+    return serializer
+
+
+def _get_field_tree(serializer: BaseSerializer) -> FieldTree:
+    """
+    Get the names of the (nested) fields of serializer 'serializer'.
+    """
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+
+    return tuple(
+        (name, _get_field_tree(field) if isinstance(field, BaseSerializer) else None)
+        for name, field in serializer.fields.items()
+    )
+
+
+def _get_field_paths(fields: FieldTree, prefix: str = "") -> Iterator[str]:
+    """
+    Get the (dotted) paths of fields 'fields' and their nested fields.
+    """
+    for name, nested in fields:
+        if nested:
+            yield from _get_field_paths(nested, prefix + name + ".")
+        else:
+            yield prefix + name
+
+
+def _select_fields(serializer: BaseSerializer, fields: FieldTree) -> None:
+    """
+    Remove the (nested) fields of serializer 'serializer' that are not in fields 'fields'.
+    """
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+
+    names = dict(fields)
+
+    for name in [name for name in serializer.fields if name not in names]:
+        serializer.fields.pop(name)
+
+    missing = [name for name in names if name not in serializer.fields]
+    if missing:
+        raise ValueError(
+            "Fields {} of '{}' cannot be built without the serializer's context".format(
+                missing, type(serializer).__name__
+            )
+        )
+
+    for name, nested in fields:
+        if nested is not None:
+            _select_fields(serializer.fields[name], nested)
+
+
+def _init_worker() -> None:
+    """
+    Set up Django in a (spawned) worker process.
+    """
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
@@ -0,0 +1,146 @@
+from typing import Dict, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import F, TextField
+from django.db.models.expressions import Expression
+from django.db.models.functions import Cast
+from rest_framework import serializers
+
+try:
+    from django.db.models.functions import JSONObject
+except ImportError:  # pragma: no cover
+    # Django < 3.2
+    JSONObject = None
+
+__all__ = ("get_json_projection", "supports_json_projection")
+
+# database vendors of which JSON objects keep the order of their keys (MySQL, for one, sorts them)
+JSON_PROJECTION_VENDORS = ("sqlite", "postgresql")
+
+# (built-in) integer model field classes
+INTEGER_FIELD_TYPES = tuple(
+    field_class
+    for field_class in (
+        models.IntegerField,
+        models.SmallIntegerField,
+        models.BigIntegerField,
+        models.PositiveIntegerField,
+        models.PositiveSmallIntegerField,
+        getattr(models, "PositiveBigIntegerField", None),  # Django 3.1+
+        models.AutoField,
+        getattr(models, "SmallAutoField", None),  # Django 3.0+
+        models.BigAutoField,
+    )
+    if field_class is not None
+)
+
+# serializer field classes -> model field classes of which the database value equals the serialized value (floats
+# are not, since databases may round them to 15 significant digits in JSON). Subclasses are not included, since they
+# may convert the database value (e.g. with from_db_value).
+SIMPLE_FIELD_TYPES = {
+    serializers.IntegerField: INTEGER_FIELD_TYPES,
+    serializers.CharField: (models.CharField, models.TextField),
+    serializers.EmailField: (models.EmailField,),
+    serializers.SlugField: (models.SlugField,),
+    serializers.URLField: (models.URLField,),
+}
+
+
+if JSONObject is not None:
+
+    class OrderedJSONObject(JSONObject):
+        """
+        JSONObject that keeps the order of its keys on PostgreSQL, where JSONObject uses JSONB_BUILD_OBJECT (which
+        sorts them).
+        """
+
+        def as_postgresql(self, compiler, connection, **extra_context):
+            copy = self.copy()
+            copy.set_source_expressions([
+                Cast(expression, TextField()) if index % 2 == 0 else expression
+                for index, expression in enumerate(copy.get_source_expressions())
+            ])
+            return copy.as_sql(compiler, connection, function="JSON_BUILD_OBJECT", **extra_context)
+
+
+def supports_json_projection(connection) -> bool:
+    """
+    Check whether the database of connection 'connection' can build the serialized objects as JSON.
+    """
+    return (
+        JSONObject is not None
+        and connection.vendor in JSON_PROJECTION_VENDORS
+        and connection.features.has_json_object_function
+    )
+
+
+def get_json_projection(serializer: serializers.BaseSerializer, model) -> Optional[Expression]:
+    """
+    Compile the (resolved) fields of model serializer 'serializer' for model 'model' into an expression that builds
+    the serialized object as JSON text in the database. Returns None if a field cannot be expressed in SQL.
+    """
+    if JSONObject is None:
+        return None
+
+    expressions = _get_field_expressions(serializer, model, "")
+
+    if expressions is None:
+        return None
+
+    return Cast(OrderedJSONObject(**expressions), output_field=TextField())
+
+
+def _get_field_expressions(
+    serializer: serializers.BaseSerializer, model, prefix: str
+) -> Optional[Dict[str, Expression]]:
+    """
+    Get the expressions of the readable fields of serializer 'serializer' for model 'model', where 'prefix' is the
+    lookup path from the root model. Returns None if a field cannot be expressed in SQL.
+    """
+    if (
+        not isinstance(serializer, serializers.ModelSerializer)
+        or serializer.Meta.model is not model
+        or type(serializer).to_representation is not serializers.Serializer.to_representation
+    ):
+        return None
+
+    expressions = {}
+
+    for field in serializer._readable_fields:
+        if len(field.source_attrs) != 1:
+            return None
+
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+
+        if not model_field.concrete:
+            return None
+
+        if isinstance(field, serializers.ModelSerializer):
+            # nested serializers of nullable relations serialize to null, which JSON_OBJECT cannot express
+            if not (model_field.many_to_one or model_field.one_to_one) or model_field.null:
+                return None
+
+            nested = _get_field_expressions(field, model_field.related_model, prefix + field.source + "__")
+            if nested is None:
+                return None
+
+            expressions[field.field_name] = OrderedJSONObject(**nested)
+        elif type(field) is serializers.PrimaryKeyRelatedField:
+            if (
+                not (model_field.many_to_one or model_field.one_to_one)
+                or field.pk_field is not None
+                or type(model_field.target_field) not in INTEGER_FIELD_TYPES
+            ):
+                return None
+
+            expressions[field.field_name] = F(prefix + model_field.attname)
+        elif type(model_field) in SIMPLE_FIELD_TYPES.get(type(field), ()):
+            expressions[field.field_name] = F(prefix + field.source)
+        else:
+            return None
+
+    return expressions
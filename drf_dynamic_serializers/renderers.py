@@ -0,0 +1,81 @@
+import math
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+__all__ = ("DynamicFieldsJSONRenderer",)
+
+
+class DynamicFieldsJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes with orjson (if it is installed) for compact, unicode responses, which is the default
+    for JSONRenderer. Values that orjson does not support natively (e.g. Decimal, lazy strings and datetimes) are
+    encoded by the encoder class. The output decodes to the same data as JSONRenderer's output, but it is not
+    byte-identical: floats may be formatted differently (e.g. 1e16 instead of 1e+16). NaN and Infinity are rejected
+    like JSONRenderer does if STRICT_JSON is enabled and rendered as null otherwise. Falls back to JSONRenderer if
+    orjson is not installed, cannot encode the data or the response is indented, not compact or ASCII only.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        """
+        Render data 'data' into JSON, returning a bytestring.
+        """
+        if not self._is_eligible_for_orjson(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers that do not fit in 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson renders NaN and Infinity as null, which JSONRenderer rejects if strict
+        if self.strict and b"null" in ret and _contains_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # escape \u2028 and \u2029 like JSONRenderer, to ensure that the output is a strict javascript subset
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+        return ret
+
+    def _is_eligible_for_orjson(self, accepted_media_type, renderer_context: dict) -> bool:
+        """
+        Verify whether the response can be rendered by orjson. This is the case if all of the following conditions
+        are fulfilled:
+        - orjson is installed
+        - response is compact, unicode and not indented
+        """
+        return (
+            orjson is not None
+            and self.compact
+            and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
+
+
+def _contains_non_finite_float(data) -> bool:
+    """
+    Check whether data 'data' contains NaN or Infinity.
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+
+    if isinstance(data, dict):
+        return any(_contains_non_finite_float(value) for value in data.values())
+
+    if isinstance(data, (list, tuple)):
+        return any(_contains_non_finite_float(value) for value in data)
+
+    return False
@@ -1,8 +1,13 @@
-from rest_framework.serializers import Serializer, ModelSerializer
+from typing import Optional
 
+from django.db import models
+from rest_framework.serializers import ListSerializer, Serializer, ModelSerializer
+
+from .conf import app_settings
 from .mixins import DynamicFieldsSerializerMixin
+from .parallel import describe_serializer, serialize_chunks
 
-__all__ = ("DynamicFieldsSerializer", "DynamicFieldsModelSerializer")
+__all__ = ("DynamicFieldsSerializer", "DynamicFieldsModelSerializer", "DynamicFieldsParallelListSerializer")
 
 
 class DynamicFieldsSerializer(DynamicFieldsSerializerMixin, Serializer):
@@ -19,3 +24,44 @@ class DynamicFieldsModelSerializer(DynamicFieldsSerializerMixin, ModelSerializer
     """
 
     pass
+
+
+class DynamicFieldsParallelListSerializer(ListSerializer):
+    """
+    List serializer that splits large lists into chunks and serializes them in a process pool, using the child's
+    resolved field selection. Results are merged in order. Use it as 'list_serializer_class' of a serializer's Meta.
+
+    The child is sent to the workers by class and resolved field names only, so its context (e.g. the request) is not
+    available during serialization and the rows must be picklable.
+    """
+
+    # override the DRF_DYNAMIC_SERIALIZERS_PARALLEL_* settings
+    min_rows: Optional[int] = None
+    chunk_size: Optional[int] = None
+    max_workers: Optional[int] = None
+
+    def to_representation(self, data) -> list:
+        """
+        List of object instances -> List of dicts of primitive datatypes.
+        """
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        rows = list(iterable)
+
+        if len(rows) < self._get_setting("min_rows"):
+            return super().to_representation(rows)
+
+        chunk_size = self._get_setting("chunk_size")
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+
+        return serialize_chunks(describe_serializer(self.child), chunks, self._get_setting("max_workers"))
+
+    def _get_setting(self, name: str):
+        """
+        Get value of setting 'name' of this serializer, falling back to the app setting.
+        """
+        value = getattr(self, name)
+
+        if value is None:
+            value = getattr(app_settings, "PARALLEL_{}".format(name.upper()))
+
+        return value
@@ -0,0 +1,231 @@
+import re
+from collections import Counter
+from contextlib import ExitStack
+from time import perf_counter
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.http import QueryDict
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.serializers import BaseSerializer, ListSerializer
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.viewsets import GenericViewSet
+
+from .explain import QueryCollector
+
+try:
+    import pytest
+except ImportError:  # pragma: no cover
+    pytest = None
+
+__all__ = ("DynamicFieldsQueryCountTestCaseMixin", "assert_query_count_is_constant")
+
+Selection = Union[str, Mapping[str, str]]
+
+factory = APIRequestFactory()
+
+# matches the (quoted) table name of the FROM clause of a query
+FROM_TABLE_RE = re.compile(r'\bFROM\s+["`\[]?(\w+)')
+
+
+def assert_query_count_is_constant(
+    viewset_class: Type[GenericViewSet],
+    selections: Iterable[Selection],
+    page_sizes: Sequence[int] = (1, 10),
+    time_budget: Optional[float] = None,
+    user=None,
+) -> None:
+    """
+    Assert that the list action of viewset class 'viewset_class' executes the same number of queries for every page
+    size in 'page_sizes', for every selection in 'selections' (e.g. "fields=id,comments.user" or {"exclude": "id"}).
+    If 'time_budget' is given, every request must take at most 'time_budget' seconds. Requests are authenticated as
+    user 'user' if it is given.
+
+    The database must contain at least max(page_sizes) objects. Raises an AssertionError that names the nested path
+    that causes the N+1 queries if the number of queries grows with the page size.
+    """
+    for selection in selections:
+        params = QueryDict(selection).dict() if isinstance(selection, str) else dict(selection)
+        runs = {}
+
+        for page_size in sorted(page_sizes):
+            queries, duration = _run(viewset_class, params, page_size, user)
+
+            if time_budget is not None and duration > time_budget:
+                raise AssertionError(
+                    "Selection {!r} with page size {} took {:.3f}s, which exceeds the time budget of {:.3f}s.".format(
+                        selection, page_size, duration, time_budget
+                    )
+                )
+
+            runs[page_size] = queries
+
+        smallest, largest = min(runs), max(runs)
+
+        if len(runs[largest]) != len(runs[smallest]):
+            raise AssertionError(
+                "Selection {!r} executes {} queries for page size {} and {} queries for page size {}.\n{}".format(
+                    selection,
+                    len(runs[smallest]),
+                    smallest,
+                    len(runs[largest]),
+                    largest,
+                    _describe_growth(viewset_class, params, runs[smallest], runs[largest], user),
+                )
+            )
+
+
+class DynamicFieldsQueryCountTestCaseMixin:
+    """
+    Mixin for (Django) test cases that adds an assertion that a dynamic fields viewset executes a constant number of
+    queries regardless of the page size.
+    """
+
+    def assertQueryCountIsConstant(
+        self,
+        viewset_class: Type[GenericViewSet],
+        selections: Iterable[Selection],
+        page_sizes: Sequence[int] = (1, 10),
+        time_budget: Optional[float] = None,
+        user=None,
+    ) -> None:
+        """
+        See assert_query_count_is_constant.
+        """
+        assert_query_count_is_constant(viewset_class, selections, page_sizes, time_budget, user)
+
+
+if pytest is not None:
+
+    @pytest.fixture
+    def query_count_is_constant(db):
+        """
+        Fixture that provides assert_query_count_is_constant. Requires pytest-django.
+        """
+        return assert_query_count_is_constant
+
+
+def _run(
+    viewset_class: Type[GenericViewSet], params: Dict[str, str], page_size: int, user
+) -> Tuple[List[dict], float]:
+    """
+    Request the list action of viewset class 'viewset_class' with query params 'params' and page size 'page_size'.
+    Returns the executed queries and the duration of the request.
+    """
+    pagination_class = type(
+        "PageSizePagination",
+        (viewset_class.pagination_class or PageNumberPagination,),
+        {"page_size": page_size, "default_limit": page_size},
+    )
+    view = type(viewset_class.__name__, (viewset_class,), {"pagination_class": pagination_class}).as_view(
+        {"get": "list"}
+    )
+
+    request = factory.get("/", data=params)
+    if user is not None:
+        force_authenticate(request, user=user)
+
+    collector = QueryCollector()
+
+    start = perf_counter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(collector))
+        response = view(request)
+        response.render()
+    duration = perf_counter() - start
+
+    if response.status_code != 200:
+        raise AssertionError("Request with query params {!r} returned status code {}.".format(
+            params, response.status_code
+        ))
+
+    results = response.data.get("results") if isinstance(response.data, dict) else None
+    if not isinstance(results, list):
+        raise AssertionError(
+            "Request with query params {!r} did not return a page with a 'results' list (the page envelope of the "
+            "pagination class is not supported).".format(params)
+        )
+
+    if len(results) != page_size:
+        raise AssertionError("Page size {} requires at least {} objects, got {}.".format(
+            page_size, page_size, len(results)
+        ))
+
+    return collector.queries, duration
+
+
+def _describe_growth(
+    viewset_class: Type[GenericViewSet], params: Dict[str, str], smallest: List[dict], largest: List[dict], user
+) -> str:
+    """
+    Describe the queries that are executed more often in run 'largest' than in run 'smallest' and the nested paths of
+    the tables they query.
+    """
+    paths = _get_table_paths(viewset_class, params, user)
+    growth = Counter(query["sql"] for query in largest)
+    growth.subtract(query["sql"] for query in smallest)
+
+    lines = []
+    for sql, count in growth.items():
+        if count <= 0:
+            continue
+
+        match = FROM_TABLE_RE.search(sql)
+        table = match.group(1) if match else None
+
+        lines.append("N+1 at {}: {} extra queries: {}".format(
+            ", ".join(paths.get(table, ["<unknown>"])), count, sql
+        ))
+
+    return "\n".join(lines)
+
+
+def _get_table_paths(viewset_class: Type[GenericViewSet], params: Dict[str, str], user) -> Dict[str, List[str]]:
+    """
+    Get the nested paths of the relations that are serialized by the list action of viewset class 'viewset_class'
+    with query params 'params', by database table.
+    """
+    request = factory.get("/", data=params)
+    if user is not None:
+        force_authenticate(request, user=user)
+
+    view = viewset_class(action_map={"get": "list"}, format_kwarg=None, args=(), kwargs={})
+    view.request = view.initialize_request(request)
+
+    serializer = view.get_serializer(many=True)
+    model = getattr(getattr(serializer.child, "Meta", None), "model", None) or view.get_queryset().model
+
+    paths = {}
+    _collect_table_paths(serializer, model, "", paths)
+
+    return paths
+
+
+def _collect_table_paths(serializer: BaseSerializer, model, prefix: str, paths: Dict[str, List[str]]) -> None:
+    """
+    Collect the paths of the relation fields of serializer 'serializer' for model 'model' into 'paths'.
+    """
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+
+    for name, field in getattr(serializer, "fields", {}).items():
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            continue
+
+        if not model_field.is_relation:
+            continue
+
+        path = prefix + name
+        related_model = model_field.related_model
+        paths.setdefault(related_model._meta.db_table, []).append(path)
+
+        if model_field.many_to_many:
+            through = getattr(model_field.remote_field, "through", None) or model_field.through
+            paths.setdefault(through._meta.db_table, []).append(path)
+
+        if isinstance(field, BaseSerializer):
+            _collect_table_paths(field, related_model, path + ".", paths)
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import models
+
+
+class UpperCaseCharField(models.CharField):
+
+    def from_db_value(self, value, expression, connection):
+        return value if value is None else value.upper()
+
+
+class Post(models.Model):
+
+    title = models.CharField(max_length=100)
+    body = models.TextField()
+
+    class Meta:
+        app_label = "tests"
+
+
+class Rating(models.Model):
+
+    post = models.ForeignKey(Post, related_name="ratings", on_delete=models.CASCADE)
+    score = models.FloatField()
+    label = UpperCaseCharField(max_length=100, default="")
+
+    class Meta:
+        app_label = "tests"
+
+
+class Comment(models.Model):
+
+    post = models.ForeignKey(Post, related_name="comments", on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    text = models.CharField(max_length=100)
+
+    class Meta:
+        app_label = "tests"
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.admin",
     "drf_dynamic_serializers",
+    "tests",
 ]
 
 TEMPLATES = [
@@ -0,0 +1,19 @@
+from django.test import TestCase, override_settings
+
+from drf_dynamic_serializers.conf import app_settings
+
+
+class AppSettingsTestCase(TestCase):
+
+    def test_default(self):
+        self.assertEqual(app_settings.QUERY_PARAM_INCLUDED_FIELDS, "fields")
+
+    def test_setting_changed(self):
+        with override_settings(DRF_DYNAMIC_SERIALIZERS_QUERY_PARAM_INCLUDED_FIELDS="only"):
+            self.assertEqual(app_settings.QUERY_PARAM_INCLUDED_FIELDS, "only")
+
+        self.assertEqual(app_settings.QUERY_PARAM_INCLUDED_FIELDS, "fields")
+
+    def test_invalid_setting(self):
+        with self.assertRaises(AttributeError):
+            app_settings.INVALID
@@ -0,0 +1,176 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import Length
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from drf_dynamic_serializers.pagination import (
+    DynamicFieldsCursorPagination,
+    DynamicFieldsLimitOffsetPagination,
+    DynamicFieldsPageNumberPagination,
+)
+from drf_dynamic_serializers.serializers import DynamicFieldsModelSerializer
+from drf_dynamic_serializers.views import DynamicFieldsModelViewSet
+from tests.models import Comment, Post
+
+factory = APIRequestFactory()
+
+
+class PostSerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = Post
+        fields = ("id", "title", "body")
+
+
+class PostViewSet(DynamicFieldsModelViewSet):
+    queryset = (
+        Post.objects.annotate(title_length=Length("title")).prefetch_related("comments").order_by("-title_length")
+    )
+    serializer_class = PostSerializer
+
+
+class GetCountQuerysetTestCase(TestCase):
+
+    def setUp(self) -> None:
+        user = User.objects.create(username="user")
+        for title in ("a", "bb", "ccc"):
+            post = Post.objects.create(title=title, body="body")
+            Comment.objects.create(post=post, user=user, text="text")
+
+        self.view = PostViewSet()
+
+    def test_removes_unused(self):
+        queryset = self.view.get_count_queryset(PostViewSet.queryset.select_related())
+
+        self.assertEqual(queryset.query.annotations, {})
+        self.assertEqual(queryset.query.order_by, ())
+        self.assertFalse(queryset.query.select_related)
+        self.assertEqual(queryset._prefetch_related_lookups, ())
+        self.assertEqual(queryset.count(), 3)
+
+    def test_keeps_aggregates(self):
+        queryset = self.view.get_count_queryset(
+            Post.objects.annotate(title_length=Length("title"), num_comments=Count("comments"))
+        )
+
+        self.assertEqual(list(queryset.query.annotations), ["num_comments"])
+        self.assertEqual(queryset.count(), 3)
+
+    def test_filtered_annotation(self):
+        queryset = self.view.get_count_queryset(PostViewSet.queryset.filter(title_length__gt=1))
+
+        self.assertEqual(queryset.count(), 2)
+
+    def test_distinct(self):
+        queryset = self.view.get_count_queryset(PostViewSet.queryset.distinct())
+
+        self.assertEqual(list(queryset.query.annotations), ["title_length"])
+
+    def test_values(self):
+        queryset = self.view.get_count_queryset(PostViewSet.queryset.values("id"))
+
+        self.assertEqual(list(queryset.query.annotations), ["title_length"])
+        self.assertEqual(queryset.query.order_by, ())
+        self.assertEqual(queryset.count(), 3)
+
+    def test_values_list_annotation(self):
+        queryset = self.view.get_count_queryset(PostViewSet.queryset.values_list("title_length", flat=True))
+
+        self.assertEqual(queryset.query.order_by, ())
+        self.assertEqual(queryset.count(), 3)
+
+    def test_sliced(self):
+        queryset = PostViewSet.queryset[:2]
+
+        self.assertIs(self.view.get_count_queryset(queryset), queryset)
+
+
+class DynamicFieldsCountPaginationTestCase(TestCase):
+
+    def setUp(self) -> None:
+        for title in ("a", "bb", "ccc"):
+            Post.objects.create(title=title, body="body")
+
+    def assertCountQuery(self, pagination_class):
+        class ViewSet(PostViewSet):
+            pass
+
+        ViewSet.pagination_class = type("Pagination", (pagination_class,), {
+            "page_size": 2, "default_limit": 2,
+        })
+        view = ViewSet.as_view({"get": "list"})
+
+        with CaptureQueriesContext(connection) as context:
+            response = view(factory.get("/", data={"fields": "id"}))
+
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual([post["id"] for post in response.data["results"]], [3, 2])
+        self.assertNotIn("LENGTH", context.captured_queries[0]["sql"])
+        self.assertNotIn("ORDER BY", context.captured_queries[0]["sql"])
+
+    def test_page_number(self):
+        self.assertCountQuery(DynamicFieldsPageNumberPagination)
+
+    def test_page_number_last_page(self):
+        class ViewSet(PostViewSet):
+            pagination_class = type("Pagination", (DynamicFieldsPageNumberPagination,), {"page_size": 2})
+
+        response = ViewSet.as_view({"get": "list"})(factory.get("/", data={"page": 2}))
+
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_limit_offset(self):
+        self.assertCountQuery(DynamicFieldsLimitOffsetPagination)
+
+
+class DynamicFieldsCursorPaginationTestCase(TestCase):
+
+    def setUp(self) -> None:
+        for title in ("a", "bb", "ccc"):
+            Post.objects.create(title=title, body=title)
+
+    def get_view(self, queryset):
+        class ViewSet(DynamicFieldsModelViewSet):
+            serializer_class = PostSerializer
+            pagination_class = type("Pagination", (DynamicFieldsCursorPagination,), {
+                "page_size": 2, "ordering": "-body",
+            })
+
+        ViewSet.queryset = queryset
+
+        return ViewSet.as_view({"get": "list"})
+
+    def test_loads_ordering_fields_only(self):
+        with self.assertNumQueries(1):
+            response = self.get_view(Post.objects.only("id"))(factory.get("/", data={"fields": "id"}))
+
+        self.assertEqual([post["id"] for post in response.data["results"]], [3, 2])
+        self.assertIsNotNone(response.data["next"])
+
+    def test_loads_ordering_fields_defer(self):
+        with self.assertNumQueries(1):
+            response = self.get_view(Post.objects.defer("title", "body"))(factory.get("/", data={"fields": "id"}))
+
+        self.assertEqual([post["id"] for post in response.data["results"]], [3, 2])
+
+    def test_ordering_by_annotation(self):
+        view = self.get_view(Post.objects.annotate(tl=Length("title")).only("id"))
+        view.cls.pagination_class.ordering = "-tl"
+
+        with self.assertNumQueries(1):
+            response = view(factory.get("/", data={"fields": "id"}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([post["id"] for post in response.data["results"]], [3, 2])
+
+    def test_next_page(self):
+        view = self.get_view(Post.objects.only("id"))
+        response = view(factory.get("/", data={"fields": "id"}))
+
+        response = view(factory.get(response.data["next"]))
+
+        self.assertEqual([post["id"] for post in response.data["results"]], [1])
@@ -0,0 +1,252 @@
+import json
+from unittest import mock, skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import TestCase, override_settings
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ListSerializer
+from rest_framework.test import APIRequestFactory
+
+from drf_dynamic_serializers.explain import Explain
+from drf_dynamic_serializers.mixins import DynamicFieldsViewMixin
+from drf_dynamic_serializers.pagination import DynamicFieldsLimitOffsetPagination, DynamicFieldsPageNumberPagination
+from drf_dynamic_serializers.projection import JSONObject
+from drf_dynamic_serializers.renderers import DynamicFieldsJSONRenderer
+from drf_dynamic_serializers.serializers import DynamicFieldsModelSerializer
+from drf_dynamic_serializers.views import DynamicFieldsModelViewSet
+from tests.models import Comment, Post, Rating
+
+factory = APIRequestFactory()
+
+
+class UserSerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = User
+        fields = ("id", "username", "email", "is_active")
+
+
+class PostSerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = Post
+        fields = ("id", "title", "body")
+
+
+class CommentSerializer(DynamicFieldsModelSerializer):
+    post = PostSerializer()
+    user = UserSerializer()
+
+    class Meta:
+        model = Comment
+        fields = ("id", "text", "post", "user")
+
+
+class EvenListSerializer(ListSerializer):
+
+    def to_representation(self, data):
+        return [row for row in super().to_representation(data) if row["id"] % 2 == 0]
+
+
+class EvenCommentSerializer(CommentSerializer):
+
+    class Meta(CommentSerializer.Meta):
+        list_serializer_class = EvenListSerializer
+
+
+class CommentPrimaryKeySerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = Comment
+        fields = ("id", "post", "user")
+
+
+class RatingSerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = Rating
+        fields = ("id", "score", "label")
+
+
+class RatingViewSet(DynamicFieldsModelViewSet):
+    queryset = Rating.objects.order_by("id")
+    serializer_class = RatingSerializer
+
+
+class CommentViewSet(DynamicFieldsModelViewSet):
+    queryset = Comment.objects.select_related("post", "user").order_by("-id")
+    serializer_class = CommentSerializer
+
+
+class ProjectedCommentViewSet(CommentViewSet):
+    json_projection = True
+
+
+class ASCIIJSONRenderer(JSONRenderer):
+    ensure_ascii = True
+
+
+class NonCompactJSONRenderer(DynamicFieldsJSONRenderer):
+    compact = False
+
+
+class Pagination(PageNumberPagination):
+    page_size = 2
+
+
+@skipUnless(JSONObject is not None, "JSONObject requires Django 3.2+")
+class JSONProjectionTestCase(TestCase):
+
+    def setUp(self) -> None:
+        # detect (and cache) JSON support of the database, which executes queries
+        if not connection.features.has_json_object_function:
+            self.skipTest("the database cannot build JSON objects")
+
+        for i in range(3):
+            user = User.objects.create(username="user{} é".format(i), email="user{}@example.com".format(i))
+            post = Post.objects.create(title="title {}".format(i), body="body {}".format(i))
+            Comment.objects.create(post=post, user=user, text="text {}".format(i))
+
+    def get_content(self, viewset_class, params, **attrs):
+        view = type(viewset_class.__name__, (viewset_class,), attrs).as_view({"get": "list"})
+        response = view(factory.get("/", data=params))
+
+        if isinstance(response, StreamingHttpResponse):
+            return response, b"".join(response.streaming_content)
+
+        return response, response.render().content
+
+    def assertProjected(self, params, streamed, num_queries=1, **attrs):
+        _, expected = self.get_content(CommentViewSet, params, **attrs)
+
+        with self.assertNumQueries(num_queries):
+            response, content = self.get_content(ProjectedCommentViewSet, params, **attrs)
+
+        self.assertEqual(isinstance(response, StreamingHttpResponse), streamed)
+        self.assertEqual(json.loads(content), json.loads(expected))
+        self.assertEqual(content, expected)
+
+    def test_streamed(self):
+        self.assertProjected({"fields": "id,text,post,user.id,user.username"}, streamed=True)
+
+    def test_excluded_fields(self):
+        self.assertProjected({"exclude": "post,user.is_active"}, streamed=True)
+
+    def test_primary_key_related_field(self):
+        self.assertProjected({}, streamed=True, serializer_class=CommentPrimaryKeySerializer)
+
+    def test_streamed_dynamic_fields_renderer(self):
+        self.assertProjected(
+            {"fields": "id,user.username"}, streamed=True, renderer_classes=[DynamicFieldsJSONRenderer]
+        )
+
+    def test_not_streamed_renderer(self):
+        for renderer_class in (ASCIIJSONRenderer, NonCompactJSONRenderer):
+            with self.subTest(renderer_class=renderer_class):
+                self.assertProjected(
+                    {"fields": "id,user.username"}, streamed=False, renderer_classes=[renderer_class]
+                )
+
+    def test_paginated(self):
+        # count and page
+        self.assertProjected(
+            {"fields": "id,post.title,user.email", "page": 2},
+            streamed=False,
+            num_queries=2,
+            pagination_class=Pagination,
+        )
+
+    def test_paginated_count_queryset(self):
+        for pagination_class in (DynamicFieldsPageNumberPagination, DynamicFieldsLimitOffsetPagination):
+            with self.subTest(pagination_class=pagination_class):
+                pagination_class = type("Pagination", (pagination_class,), {"page_size": 2, "default_limit": 2})
+
+                self.assertProjected(
+                    {"fields": "id,post.title", "offset": 2}, streamed=False, num_queries=2,
+                    pagination_class=pagination_class,
+                )
+
+    def test_fallback(self):
+        # booleans are not rendered as JSON booleans by all databases
+        _, expected = self.get_content(CommentViewSet, {"fields": "id,user.is_active"})
+
+        with self.assertNumQueries(1):
+            response, content = self.get_content(ProjectedCommentViewSet, {"fields": "id,user.is_active"})
+
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(content, expected)
+
+    def test_fallback_paginated(self):
+        self.assertProjected(
+            {"fields": "id,user.is_active", "page": 2}, streamed=False, num_queries=2, pagination_class=Pagination
+        )
+
+    @override_settings(DEBUG=True)
+    def test_fallback_filters_and_builds_serializer_once(self):
+        with mock.patch.object(
+            DynamicFieldsViewMixin, "filter_queryset", autospec=True, side_effect=DynamicFieldsViewMixin.filter_queryset
+        ) as filter_queryset, mock.patch.object(
+            Explain, "add_serializer", autospec=True, side_effect=Explain.add_serializer
+        ) as add_serializer:
+            _, content = self.get_content(ProjectedCommentViewSet, {"fields": "id,user.is_active", "explain": ""})
+
+        self.assertEqual(filter_queryset.call_count, 1)
+        self.assertEqual(add_serializer.call_count, 1)
+        self.assertEqual(json.loads(content)["data"][0], {"id": 3, "user": {"is_active": True}})
+
+    def test_fallback_float(self):
+        # SQLite keeps 15 significant digits of floats in JSON
+        Rating.objects.create(post=Post.objects.first(), score=123456789.123456789)
+        _, expected = self.get_content(RatingViewSet, {})
+
+        response, content = self.get_content(RatingViewSet, {}, json_projection=True)
+
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(content, expected)
+        self.assertEqual(json.loads(content)[0]["score"], 123456789.123456789)
+
+    def test_fallback_list_serializer(self):
+        self.assertProjected({"fields": "id,text"}, streamed=False, serializer_class=EvenCommentSerializer)
+
+        _, content = self.get_content(ProjectedCommentViewSet, {"fields": "id"}, serializer_class=EvenCommentSerializer)
+        self.assertEqual(json.loads(content), [{"id": 2}])
+
+    def test_fallback_converted_field(self):
+        # fields that convert the database value are serialized as usual
+        Rating.objects.create(post=Post.objects.first(), score=1, label="abc")
+        _, expected = self.get_content(RatingViewSet, {"fields": "id,label"})
+
+        response, content = self.get_content(RatingViewSet, {"fields": "id,label"}, json_projection=True)
+
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(content, expected)
+        self.assertEqual(json.loads(content)[0]["label"], "ABC")
+
+    def test_fallback_vendor(self):
+        # MySQL sorts the keys of JSON objects
+        _, expected = self.get_content(CommentViewSet, {"fields": "id,text"})
+
+        with mock.patch.object(connection, "vendor", "mysql"):
+            response, content = self.get_content(ProjectedCommentViewSet, {"fields": "id,text"})
+
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(content, expected)
+
+    def test_fallback_cursor_pagination(self):
+        pagination_class = type("Pagination", (CursorPagination,), {"page_size": 2, "ordering": "-id"})
+        response, content = self.get_content(
+            ProjectedCommentViewSet, {"fields": "id"}, pagination_class=pagination_class
+        )
+        _, expected = self.get_content(CommentViewSet, {"fields": "id"}, pagination_class=pagination_class)
+
+        self.assertEqual(content, expected)
+
+    @override_settings(DEBUG=True)
+    def test_explain(self):
+        response, content = self.get_content(ProjectedCommentViewSet, {"fields": "id", "explain": ""})
+
+        self.assertEqual(json.loads(content)["data"], [{"id": 3}, {"id": 2}, {"id": 1}])
+        self.assertTrue(any("JSON_OBJECT" in query["sql"] for query in response.data["explain"]["queries"]))
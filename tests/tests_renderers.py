@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+from django.utils.functional import lazy
+from rest_framework.renderers import JSONRenderer
+
+from drf_dynamic_serializers import renderers
+from drf_dynamic_serializers.renderers import DynamicFieldsJSONRenderer
+
+
+class DynamicFieldsJSONRendererTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.renderer = DynamicFieldsJSONRenderer()
+        self.data = [
+            OrderedDict([
+                ("id", 1),
+                ("char", "é  "),
+                ("decimal", Decimal("1.5")),
+                ("lazy", lazy(lambda: "lazy", str)()),
+                ("datetime", datetime(2020, 1, 1, 12, 0, 0, 123456)),
+                ("nested", {1: None, "list": [True, 1.5]}),
+            ])
+        ]
+
+    def test_render(self):
+        self.assertEqual(self.renderer.render(self.data), JSONRenderer().render(self.data))
+
+    def test_render_none(self):
+        self.assertEqual(self.renderer.render(None), b"")
+
+    def test_render_indent(self):
+        with mock.patch.object(renderers.orjson, "dumps") as dumps:
+            ret = self.renderer.render(self.data, "application/json; indent=4")
+
+        dumps.assert_not_called()
+        self.assertEqual(ret, JSONRenderer().render(self.data, "application/json; indent=4"))
+
+    def test_render_without_orjson(self):
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(self.renderer.render(self.data), JSONRenderer().render(self.data))
+
+    def test_render_non_finite_float(self):
+        data = {"a": None, "nested": [1.5, float("nan")]}
+
+        with self.assertRaisesMessage(ValueError, "Out of range float values are not JSON compliant"):
+            self.renderer.render(data)
+
+        with mock.patch.object(self.renderer, "strict", False):
+            self.assertEqual(self.renderer.render(data), b'{"a":null,"nested":[1.5,null]}')
+
+    def test_render_unsupported_by_orjson(self):
+        data = {"a": 2 ** 70}
+
+        self.assertEqual(self.renderer.render(data), JSONRenderer().render(data))
@@ -1,8 +1,19 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.db import models
 from django.test import TestCase
 from rest_framework import serializers
 
-from drf_dynamic_serializers.serializers import DynamicFieldsSerializer, DynamicFieldsModelSerializer
+from drf_dynamic_serializers.parallel import get_executor
+from drf_dynamic_serializers.serializers import (
+    DynamicFieldsSerializer,
+    DynamicFieldsModelSerializer,
+    DynamicFieldsParallelListSerializer,
+)
+from tests.models import Comment, Post
 from tests.tests_mixins import DynamicFieldsSerializerMixinTestCase
 
 
@@ -90,3 +101,137 @@ class DynamicFieldsModelSerializerTestCase(DynamicFieldsSerializerMixinTestCase,
     def setUp(self) -> None:
         self.foo = Foo(char="a", integer=1)
         self.bar = Bar(boolean=True, foo=self.foo)
+
+
+class FooParallelListSerializer(DynamicFieldsParallelListSerializer):
+    min_rows = 0
+    chunk_size = 2
+    max_workers = 2
+
+
+class ParallelFooSerializer(FooSerializer):
+
+    class Meta:
+        list_serializer_class = FooParallelListSerializer
+
+
+class ContextParallelFooSerializer(ParallelFooSerializer):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if self.context.get("hide_integer"):
+            self.fields.pop("integer")
+
+
+class CrashingParallelListSerializer(FooParallelListSerializer):
+    max_workers = 1
+
+
+class CrashingFooSerializer(FooSerializer):
+
+    class Meta:
+        list_serializer_class = CrashingParallelListSerializer
+
+    def to_representation(self, instance):
+        # kill the worker process
+        os._exit(1)
+
+
+class PostModelSerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = Post
+        fields = ("id", "title")
+
+
+class ParallelCommentModelSerializer(DynamicFieldsModelSerializer):
+    post = PostModelSerializer()
+
+    class Meta:
+        model = Comment
+        fields = ("id", "text", "post")
+        list_serializer_class = FooParallelListSerializer
+
+
+class DynamicFieldsParallelListSerializerTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.foos = [Foo(char=str(i), integer=i) for i in range(5)]
+
+    def test_serializes_in_order(self):
+        serializer = ParallelFooSerializer(self.foos, many=True)
+
+        self.assertEqual(type(serializer), FooParallelListSerializer)
+        self.assertEqual(
+            [dict(row) for row in serializer.data],
+            [{"char": str(i), "integer": i} for i in range(5)],
+        )
+
+    def test_included_fields(self):
+        serializer = ParallelFooSerializer(self.foos, many=True, included_fields=["integer"])
+
+        self.assertEqual([dict(row) for row in serializer.data], [{"integer": i} for i in range(5)])
+
+    def test_fields_removed_at_runtime(self):
+        serializer = ContextParallelFooSerializer(self.foos, many=True, context={"hide_integer": True})
+
+        self.assertEqual([dict(row) for row in serializer.data], [{"char": str(i)} for i in range(5)])
+
+    def test_broken_pool(self):
+        executor = get_executor(1)
+
+        with self.assertRaises(BrokenProcessPool):
+            CrashingFooSerializer(self.foos, many=True).data
+
+        # the broken pool is replaced
+        self.assertIsNot(get_executor(1), executor)
+        self.assertEqual(get_executor(1).submit(int).result(), 0)
+
+    def test_below_min_rows(self):
+        serializer = ParallelFooSerializer(self.foos, many=True, excluded_fields=["integer"])
+        serializer.min_rows = 10
+
+        self.assertEqual([dict(row) for row in serializer.data], [{"char": str(i)} for i in range(5)])
+
+    def test_nested_model_serializer(self):
+        user = get_user_model().objects.create(username="user")
+        post = Post.objects.create(title="title", body="body")
+        comments = [Comment.objects.create(post=post, user=user, text=str(i)) for i in range(5)]
+
+        # the workers have their own database connections, so the nested objects are loaded up front
+        serializer = ParallelCommentModelSerializer(
+            Comment.objects.select_related("post").order_by("id"), many=True, excluded_fields=["post.id"]
+        )
+
+        self.assertEqual(
+            [{**row, "post": dict(row["post"])} for row in serializer.data],
+            [{"id": comment.id, "text": comment.text, "post": {"title": "title"}} for comment in comments],
+        )
+
+
+class DynamicFieldsModelSerializerBuildTestCase(TestCase):
+
+    def test_builds_selected_fields_only(self):
+        serializer = FooModelSerializer(included_fields=["char"])
+
+        with mock.patch.object(
+            serializers.ModelSerializer,
+            "build_field",
+            autospec=True,
+            side_effect=serializers.ModelSerializer.build_field,
+        ) as build_field, mock.patch.object(
+            serializers.CharField, "__deepcopy__", autospec=True, side_effect=serializers.CharField.__deepcopy__
+        ) as deepcopy:
+            self.assertEqual(list(serializer.fields), ["char"])
+
+        build_field.assert_not_called()
+        self.assertEqual(deepcopy.call_count, 1)
+        self.assertEqual(serializer._df_dropped_fields, ("integer", "id"))
+
+    def test_builds_fields_not_excluded(self):
+        serializer = BarModelSerializer(excluded_fields=["boolean", "foo.char"])
+
+        self.assertEqual(list(serializer.fields), ["id", "foo"])
+        self.assertEqual(list(serializer.fields["foo"].fields), ["integer"])
+        self.assertEqual(serializer._df_dropped_fields, ("boolean",))
@@ -0,0 +1,104 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+from drf_dynamic_serializers.serializers import DynamicFieldsModelSerializer
+from drf_dynamic_serializers.testing import DynamicFieldsQueryCountTestCaseMixin, query_count_is_constant  # noqa: F401
+from drf_dynamic_serializers.views import DynamicFieldsModelViewSet
+from tests.models import Comment, Post
+
+
+class UserSerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = User
+        fields = ("id", "username")
+
+
+class CommentSerializer(DynamicFieldsModelSerializer):
+    user = UserSerializer()
+
+    class Meta:
+        model = Comment
+        fields = ("id", "text", "user")
+
+
+class PostSerializer(DynamicFieldsModelSerializer):
+    comments = CommentSerializer(many=True)
+
+    class Meta:
+        model = Post
+        fields = ("id", "title", "comments")
+
+
+class PostViewSet(DynamicFieldsModelViewSet):
+    queryset = Post.objects.order_by("id")
+    serializer_class = PostSerializer
+
+
+class PrefetchedPostViewSet(PostViewSet):
+    queryset = Post.objects.prefetch_related("comments__user").order_by("id")
+
+
+class EnvelopePagination(PageNumberPagination):
+
+    def get_paginated_response(self, data):
+        return Response({"count": self.page.paginator.count, "items": data})
+
+
+class EnvelopePostViewSet(PostViewSet):
+    pagination_class = EnvelopePagination
+
+
+def create_posts():
+    for i in range(3):
+        post = Post.objects.create(title="title", body="body")
+        Comment.objects.create(post=post, user=User.objects.create(username="user{}".format(i)), text="text")
+
+
+class DynamicFieldsQueryCountTestCaseMixinTestCase(DynamicFieldsQueryCountTestCaseMixin, TestCase):
+
+    def setUp(self) -> None:
+        create_posts()
+
+    def test_constant(self):
+        self.assertQueryCountIsConstant(
+            PrefetchedPostViewSet, ["fields=id,comments.user", {"exclude": "comments.user"}], page_sizes=(1, 3)
+        )
+
+    def test_constant_without_relations(self):
+        self.assertQueryCountIsConstant(PostViewSet, ["fields=id,title"], page_sizes=(1, 3))
+
+    def test_n_plus_one(self):
+        with self.assertRaisesRegex(AssertionError, "N\\+1 at comments: 2 extra queries"):
+            self.assertQueryCountIsConstant(PostViewSet, ["fields=comments.text"], page_sizes=(1, 3))
+
+    def test_n_plus_one_nested(self):
+        class ViewSet(PostViewSet):
+            queryset = Post.objects.prefetch_related("comments").order_by("id")
+
+        with self.assertRaisesRegex(AssertionError, "N\\+1 at comments.user: 2 extra queries"):
+            self.assertQueryCountIsConstant(ViewSet, ["fields=comments.user.username"], page_sizes=(1, 3))
+
+    def test_time_budget(self):
+        with self.assertRaisesRegex(AssertionError, "exceeds the time budget"):
+            self.assertQueryCountIsConstant(PrefetchedPostViewSet, ["fields=id"], time_budget=0)
+
+    def test_not_enough_objects(self):
+        with self.assertRaisesRegex(AssertionError, "requires at least 10 objects"):
+            self.assertQueryCountIsConstant(PrefetchedPostViewSet, ["fields=id"], page_sizes=(1, 10))
+
+    def test_unsupported_page_envelope(self):
+        with self.assertRaisesRegex(AssertionError, "did not return a page with a 'results' list"):
+            self.assertQueryCountIsConstant(EnvelopePostViewSet, ["fields=id"], page_sizes=(1, 3))
+
+
+def test_query_count_is_constant_fixture(query_count_is_constant):
+    create_posts()
+
+    query_count_is_constant(PrefetchedPostViewSet, ["fields=comments.user.username"], page_sizes=(1, 3))
+
+    with pytest.raises(AssertionError, match="N\\+1 at comments.user"):
+        query_count_is_constant(PostViewSet, ["fields=comments.user.username"], page_sizes=(1, 3))
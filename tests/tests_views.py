@@ -1,3 +1,6 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
 from django.test import TestCase, override_settings
 from rest_framework import serializers
 from rest_framework.request import Request
@@ -5,8 +8,9 @@ from rest_framework.test import APIRequestFactory
 
 from drf_dynamic_serializers.conf import DynamicFieldsConfig
 from drf_dynamic_serializers.exceptions import SerializerDoesNotSupportDynamicFields
-from drf_dynamic_serializers.serializers import DynamicFieldsSerializer
+from drf_dynamic_serializers.serializers import DynamicFieldsModelSerializer, DynamicFieldsSerializer
 from drf_dynamic_serializers.views import DynamicFieldsModelViewSet
+from tests.models import Comment, Post
 
 factory = APIRequestFactory()
 
@@ -81,6 +85,51 @@ class DynamicFieldsModelViewSetTestCase(TestCase):
         self.assertEqual(type(serializer), self.viewset.serializer_class)
         self.assertEqual(serializer._df_conf, DynamicFieldsConfig())
 
+    @override_settings(DRF_DYNAMIC_SERIALIZERS_QUERY_PARAM_INCLUDED_FIELDS="only")
+    def test_query_param_included_fields_setting_changed(self):
+        self.viewset.request = Request(factory.get('/', data={"only": "char", "fields": "other"}))
+
+        serializer = self.viewset.get_serializer()
+
+        self.assertEqual(serializer._df_conf, DynamicFieldsConfig(
+            included_fields=['char']
+        ))
+
+    def test_query_param_normalized(self):
+        self.viewset.request = Request(factory.get('/', data={"fields": " char, ,", "exclude": ","}))
+
+        serializer = self.viewset.get_serializer()
+
+        self.assertEqual(serializer._df_conf, DynamicFieldsConfig(
+            included_fields=['char']
+        ))
+
+    def test_query_params_parsed_once_per_request(self):
+        self.viewset.request = Request(factory.get('/', data={"fields": "char"}))
+
+        with mock.patch.object(
+            self.viewset, "_parse_query_params_for_field", wraps=self.viewset._parse_query_params_for_field
+        ) as parse:
+            self.viewset.get_serializer()
+            self.viewset.get_serializer()
+
+        self.assertEqual(parse.call_count, 2)
+        self.assertEqual(self.viewset.request._df_query_param_selection, (["char"], None))
+
+    def test_defaults_applied_per_view(self):
+        request = Request(factory.get('/'))
+        self.viewset.default_excluded_fields = ["char"]
+        self.viewset.request = request
+        self.viewset.get_serializer()
+
+        # another view that handles the same request does not get the defaults of the first view
+        other_viewset = type(self.viewset)()
+        other_viewset.request = request
+
+        serializer = other_viewset.get_serializer()
+
+        self.assertEqual(serializer._df_conf, DynamicFieldsConfig())
+
     def test_request_non_get(self):
         self.viewset.default_excluded_fields = ["char"]
 
@@ -90,3 +139,64 @@ class DynamicFieldsModelViewSetTestCase(TestCase):
 
         self.assertEqual(type(serializer), self.viewset.serializer_class)
         self.assertEqual(serializer._df_conf, DynamicFieldsConfig())
+
+
+class CommentSerializer(DynamicFieldsModelSerializer):
+
+    class Meta:
+        model = Comment
+        fields = ("id", "text", "user")
+
+
+class PostSerializer(DynamicFieldsModelSerializer):
+    comments = CommentSerializer(many=True)
+
+    class Meta:
+        model = Post
+        fields = ("id", "title", "body", "comments")
+
+
+class PostViewSet(DynamicFieldsModelViewSet):
+    queryset = Post.objects.prefetch_related("comments")
+    serializer_class = PostSerializer
+
+
+class DynamicFieldsViewMixinExplainTestCase(TestCase):
+
+    def setUp(self) -> None:
+        user = User.objects.create(username="user")
+        post = Post.objects.create(title="title", body="body")
+        Comment.objects.create(post=post, user=user, text="text")
+
+        self.view = PostViewSet.as_view({"get": "list"})
+
+    @override_settings(DEBUG=True)
+    def test_explain(self):
+        response = self.view(factory.get("/", data={"fields": "title,comments.text", "explain": ""}))
+
+        self.assertEqual(response.data["data"], [{"title": "title", "comments": [{"text": "text"}]}])
+
+        explain = response.data["explain"]
+        self.assertEqual(explain["selection"], {"included": {"title": {}, "comments": {"text": {}}}, "excluded": {}})
+        self.assertEqual(explain["fields"], {
+            "serializer": "PostSerializer",
+            "built": ["title", "comments"],
+            "dropped": ["id", "body"],
+            "nested": {
+                "comments": {
+                    "serializer": "CommentSerializer", "built": ["text"], "dropped": ["id", "user"], "nested": {},
+                },
+            },
+        })
+        self.assertEqual(explain["queryset"], {
+            "only": None, "defer": [], "select_related": False, "prefetch_related": ["comments"],
+        })
+        self.assertEqual(len(explain["queries"]), 2)
+        self.assertEqual(
+            set(explain["timings"]), {"total", "field_resolution", "serialization", "sql"}
+        )
+
+    def test_explain_without_debug(self):
+        response = self.view(factory.get("/", data={"fields": "title", "explain": ""}))
+
+        self.assertEqual(response.data, [{"title": "title"}])